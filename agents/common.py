@@ -0,0 +1,65 @@
+# agents/common.py
+
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from tools.jsonutil import json_loads
+
+
+_models = {}
+
+
+def build_ollama_model():
+    """
+    Ollama model configured from OLLAMA_HOST / OLLAMA_MODEL.
+    One instance (and its HTTP client) is shared per (host, model), so the
+    three agents reuse the same keep-alive connection.
+    """
+    ollama_host = os.getenv("OLLAMA_HOST", "http://127.0.0.1:11500")
+    ollama_model = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
+
+    key = (ollama_host, ollama_model)
+    model = _models.get(key)
+    if model is None:
+        # strands (and its model/HTTP stack) is imported on first use, like
+        # strands.Agent in the agent constructors, so importing the agents
+        # package stays cheap for code that never builds an agent
+        from strands.models.ollama import OllamaModel
+
+        model = OllamaModel(host=ollama_host, model_id=ollama_model)
+        _models[key] = model
+    return model
+
+
+def parse_llm_json(response, fallback):
+    """
+    Decode the agent's JSON reply, or return a copy of fallback if the
+    model produced anything else. A reply wrapped in a ``` fence is
+    unwrapped by slicing off the opening fence line and the closing fence,
+    which models do not always put on a line of its own.
+    """
+    text = str(response).strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
+        if text.endswith("```"):
+            text = text[:-3]
+
+    try:
+        return json_loads(text)
+    except Exception:
+        return dict(fallback) if fallback is not None else None
+
+
+def to_prompt_json(data):
+    """
+    Serialize data for a prompt as compact JSON. The model does not need
+    indentation, and every whitespace run costs tokens.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, separators=(",", ":"))
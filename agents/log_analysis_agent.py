@@ -1,25 +1,29 @@
 # agents/log_analysis_agent.py
 
-import json
-import os
-from strands import Agent
-from strands.models.ollama import OllamaModel
+from agents.common import build_ollama_model, parse_llm_json, to_prompt_json
 
 from tools.data_preprocessor import DataPreprocessor
 
 
+_PROMPT_TEMPLATE = (
+    "Analyze this CloudWatch log summary:\n\n"
+    "%s\n\n"
+    "Identify key issues and patterns. Return JSON only."
+)
+
+
 class LogAnalysisAgent:
     """
     Log analysis using local llama3.1:8b with CloudWatch tool access.
     """
 
+    __slots__ = ("agent", "preprocessor")
+
     def __init__(self):
-        ollama_host = os.getenv("OLLAMA_HOST", "http://127.0.0.1:11500")
-        ollama_model = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
-        model = OllamaModel(host=ollama_host, model_id=ollama_model)
+        from strands import Agent
 
         self.agent = Agent(
-            model=model,
+            model=build_ollama_model(),
             tools=[],  # No tools needed - we provide preprocessed logs directly
             system_prompt=(
                 "You are an AWS CloudWatch Log Analysis agent.\n"
@@ -38,18 +42,13 @@ class LogAnalysisAgent:
         # Summarize logs to reduce token count
         logs_summary = self.preprocessor.summarize_logs(logs_bundle, max_samples=15)
         
-        prompt = (
-            "Analyze this CloudWatch log summary:\n\n"
-            f"{json.dumps(logs_summary, indent=2)}\n\n"
-            "Identify key issues and patterns. Return JSON only."
-        )
+        prompt = _PROMPT_TEMPLATE % to_prompt_json(logs_summary)
 
         response = self.agent(prompt)
 
-        try:
-            parsed = json.loads(str(response))
-        except:
-            parsed = {"summary": "LLM log parsing failed", "detected_issues": []}
+        parsed = parse_llm_json(
+            response, {"summary": "LLM log parsing failed", "detected_issues": []}
+        )
 
         incident_logger.log_logs_analysis(parsed)
         return parsed
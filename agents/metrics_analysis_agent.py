@@ -1,25 +1,29 @@
 # agents/metrics_analysis_agent.py
 
-import json
-import os
-from strands import Agent
-from strands.models.ollama import OllamaModel
+from agents.common import build_ollama_model, parse_llm_json, to_prompt_json
 
 from tools.data_preprocessor import DataPreprocessor
 
 
+_PROMPT_TEMPLATE = (
+    "Analyze these CloudWatch metrics statistics:\n\n"
+    "%s\n\n"
+    "Determine if this indicates an incident. Return ONLY JSON."
+)
+
+
 class MetricAnalysisAgent:
     """
     Metrics analysis using local llama3.1:8b with Strands tool calling.
     """
 
+    __slots__ = ("agent", "preprocessor")
+
     def __init__(self):
-        ollama_host = os.getenv("OLLAMA_HOST", "http://127.0.0.1:11500")
-        ollama_model = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
-        model = OllamaModel(host=ollama_host, model_id=ollama_model)
+        from strands import Agent
 
         self.agent = Agent(
-            model=model,
+            model=build_ollama_model(),
             tools=[],  # No tools needed - we provide preprocessed data directly
             system_prompt=(
                 "You are a CloudWatch Metrics Analysis Agent.\n"
@@ -42,18 +46,14 @@ class MetricAnalysisAgent:
         # Summarize metrics to reduce token count
         metrics_summary = self.preprocessor.summarize_metrics(metrics_bundle)
         
-        prompt = (
-            "Analyze these CloudWatch metrics statistics:\n\n"
-            f"{json.dumps(metrics_summary, indent=2)}\n\n"
-            "Determine if this indicates an incident. Return ONLY JSON."
-        )
+        prompt = _PROMPT_TEMPLATE % to_prompt_json(metrics_summary)
 
         response = self.agent(prompt)
 
-        try:
-            parsed = json.loads(str(response))
-        except:
-            parsed = {"summary": "LLM failed to parse JSON.", "overall_severity": "ok"}
+        parsed = parse_llm_json(
+            response,
+            {"summary": "LLM failed to parse JSON.", "overall_severity": "ok"},
+        )
 
         incident_logger.log_metrics_analysis(parsed)
         return parsed
@@ -1,9 +1,17 @@
 # agents/rca_agent.py
 
-import json
-import os
-from strands import Agent
-from strands.models.ollama import OllamaModel
+from agents.common import build_ollama_model, parse_llm_json, to_prompt_json
+
+
+# Compact formatting to minimize tokens
+_PROMPT_TEMPLATE = (
+    "ROOT CAUSE ANALYSIS\n\n"
+    "Metrics Analysis:\n"
+    "%s\n\n"
+    "Log Summary:\n"
+    "%s\n\n"
+    "Provide root cause and recommendation as JSON only."
+)
 
 
 class RCAAgent:
@@ -11,13 +19,13 @@ class RCAAgent:
     Root Cause Analysis agent with access to both CloudWatch tools.
     """
 
+    __slots__ = ("agent",)
+
     def __init__(self):
-        ollama_host = os.getenv("OLLAMA_HOST", "http://127.0.0.1:11500")
-        ollama_model = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
-        model = OllamaModel(host=ollama_host, model_id=ollama_model)
+        from strands import Agent
 
         self.agent = Agent(
-            model=model,
+            model=build_ollama_model(),
             tools=[],  # No tools needed - we provide analysis results directly
             system_prompt=(
                 "You are an AWS Incident Root Cause Analysis Agent.\n"
@@ -32,26 +40,21 @@ class RCAAgent:
         )
 
     def analyze(self, metrics_result, log_summary, incident_logger):
-        # Compact formatting to minimize tokens
-        prompt = (
-            "ROOT CAUSE ANALYSIS\n\n"
-            "Metrics Analysis:\n"
-            f"{json.dumps(metrics_result, indent=None)}\n\n"
-            "Log Summary:\n"
-            f"{json.dumps(log_summary, indent=None) if isinstance(log_summary, dict) else log_summary}\n\n"
-            "Provide root cause and recommendation as JSON only."
+        prompt = _PROMPT_TEMPLATE % (
+            to_prompt_json(metrics_result),
+            to_prompt_json(log_summary) if isinstance(log_summary, dict) else log_summary,
         )
 
         response = self.agent(prompt)
 
-        try:
-            parsed = json.loads(str(response))
+        parsed = parse_llm_json(response, None)
+        if isinstance(parsed, dict):
             # Ensure required fields exist
             if "root_cause" not in parsed:
                 parsed["root_cause"] = str(parsed)
             if "recommendation" not in parsed:
                 parsed["recommendation"] = "Review metrics and logs for details"
-        except:
+        else:
             parsed = {
                 "root_cause": "LLM RCA parsing failure.",
                 "recommendation": "Manual investigation recommended.",
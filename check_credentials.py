@@ -1,26 +1,53 @@
 #!/usr/bin/env python3
 
+import time
+
 import load_env  # Load AWS credentials from .env
 import boto3
 from botocore.exceptions import NoCredentialsError, ClientError
 
+# The caller identity does not change within a session; re-ask STS at most
+# this often when the check is run repeatedly in one process.
+IDENTITY_TTL_SECONDS = 600
+
+_identity_cache = None  # (identity, fetched_at)
+
+
+def get_caller_identity():
+    """Return the STS caller identity, cached for IDENTITY_TTL_SECONDS."""
+    global _identity_cache
+    now = time.monotonic()
+    if _identity_cache is None or now - _identity_cache[1] > IDENTITY_TTL_SECONDS:
+        _identity_cache = (boto3.client("sts").get_caller_identity(), now)
+    return _identity_cache[0]
+
 
 def check_aws_credentials():
     """Check if AWS credentials are properly configured"""
 
     try:
         # Test basic AWS access
-        sts = boto3.client("sts")
-        identity = sts.get_caller_identity()
+        identity = get_caller_identity()
         print(f"✓ AWS credentials configured")
         print(f"  Account: {identity['Account']}")
         print(f"  User/Role: {identity['Arn']}")
 
         # Test CloudWatch Logs access
+        # One prefix-filtered page is enough to prove access; the prefix
+        # keeps the call cheap regardless of how many groups the account has
         logs_client = boto3.client("logs")
-        log_groups = logs_client.describe_log_groups(limit=5)
+        paginator = logs_client.get_paginator("describe_log_groups")
+        first_page = next(
+            iter(
+                paginator.paginate(
+                    logGroupNamePrefix="/aws/lambda/",
+                    PaginationConfig={"PageSize": 50},
+                )
+            ),
+            {},
+        )
         print(f"✓ CloudWatch Logs access confirmed")
-        print(f"  Found {len(log_groups['logGroups'])} log groups")
+        print(f"  Found {len(first_page.get('logGroups', []))} Lambda log groups")
 
         # Test CloudWatch Metrics access
         cw_client = boto3.client("cloudwatch")
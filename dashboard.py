@@ -6,6 +6,7 @@ Displays incident analysis from the incident detection system
 import streamlit as st
 import json
 import os
+from collections import Counter
 from datetime import datetime, timedelta
 from pathlib import Path
 import pandas as pd
@@ -65,6 +66,28 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+def load_incident_index(incident_logs_dir="incident_logs"):
+    """Read incidents.jsonl (written by IncidentLogger), keyed by directory name"""
+    indexed = {}
+    index_file = Path(incident_logs_dir) / "incidents.jsonl"
+    
+    if not index_file.exists():
+        return indexed
+    
+    with open(index_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                incident_data = json.loads(line)
+            except ValueError:
+                continue  # partially written trailing line
+            name = incident_data.get('directory')
+            if name:
+                incident_data['directory'] = str(Path(incident_logs_dir) / name)
+                indexed[name] = incident_data
+    
+    return indexed
+
+
 def load_incidents(incident_logs_dir="incident_logs"):
     """Load all incidents from the incident_logs directory"""
     incidents = []
@@ -72,9 +95,17 @@ def load_incidents(incident_logs_dir="incident_logs"):
     if not os.path.exists(incident_logs_dir):
         return incidents
     
+    # Incidents already in the index need no per-directory results.json read;
+    # only directories from before the index existed are opened
+    indexed = load_incident_index(incident_logs_dir)
+    
     # Get all incident directories
     for incident_dir in Path(incident_logs_dir).iterdir():
         if incident_dir.is_dir() and incident_dir.name.startswith("incident_"):
+            if incident_dir.name in indexed:
+                incidents.append(indexed[incident_dir.name])
+                continue
+            
             results_file = incident_dir / "results.json"
             
             if results_file.exists():
@@ -123,21 +154,40 @@ def filter_by_severity(incidents, severities):
     if not severities:
         return incidents
     
-    return [inc for inc in incidents if inc.get('severity', '').lower() in [s.lower() for s in severities]]
+    wanted = {s.lower() for s in severities}
+    return [inc for inc in incidents if inc.get('severity', '').lower() in wanted]
+
+
+def count_by_severity(incidents):
+    """Count incidents per lower-cased severity in a single pass"""
+    return Counter(inc.get('severity', '').lower() for inc in incidents)
+
+
+SEVERITY_COLORS = {
+    'CRITICAL': '#dc2626',
+    'HIGH': '#ea580c',
+    'WARNING': '#fbbf24',
+    'OK': '#22c55e'
+}
+
+_OK_BADGE = '<span class="ok-badge">✅ OK</span>'
+_SEVERITY_BADGES = {
+    'critical': '<span class="critical-badge">🚨 CRITICAL</span>',
+    'high': '<span class="high-badge">⚠️ HIGH</span>',
+    'warning': '<span class="warning-badge">⚡ WARNING</span>',
+}
+# Severities arrive in a few fixed casings; index those directly so the
+# common case needs no .lower() copy
+_SEVERITY_BADGES.update({k.upper(): v for k, v in list(_SEVERITY_BADGES.items())})
+_SEVERITY_BADGES.update({k.title(): v for k, v in list(_SEVERITY_BADGES.items())})
 
 
 def get_severity_badge(severity):
     """Return HTML for severity badge"""
-    severity_lower = severity.lower()
-    
-    if severity_lower == 'critical':
-        return '<span class="critical-badge">🚨 CRITICAL</span>'
-    elif severity_lower == 'high':
-        return '<span class="high-badge">⚠️ HIGH</span>'
-    elif severity_lower == 'warning':
-        return '<span class="warning-badge">⚡ WARNING</span>'
-    else:
-        return '<span class="ok-badge">✅ OK</span>'
+    badge = _SEVERITY_BADGES.get(severity)
+    if badge is None:
+        badge = _SEVERITY_BADGES.get(severity.lower(), _OK_BADGE)
+    return badge
 
 
 def display_incident_card(incident):
@@ -237,12 +287,7 @@ def create_trends_chart(incidents):
         names='severity',
         title='Incidents by Severity',
         color='severity',
-        color_discrete_map={
-            'CRITICAL': '#dc2626',
-            'HIGH': '#ea580c',
-            'WARNING': '#fbbf24',
-            'OK': '#22c55e'
-        }
+        color_discrete_map=SEVERITY_COLORS
     )
     
     st.plotly_chart(fig_pie, use_container_width=True)
@@ -252,22 +297,14 @@ def create_trends_chart(incidents):
     
     fig_timeline = go.Figure()
     
-    for severity in df_sorted['severity'].unique():
-        severity_df = df_sorted[df_sorted['severity'] == severity]
-        
-        color_map = {
-            'CRITICAL': '#dc2626',
-            'HIGH': '#ea580c',
-            'WARNING': '#fbbf24',
-            'OK': '#22c55e'
-        }
-        
+    # One groupby pass instead of a boolean mask over the frame per severity
+    for severity, severity_df in df_sorted.groupby('severity', sort=False):
         fig_timeline.add_trace(go.Scatter(
             x=severity_df['timestamp'],
             y=[severity] * len(severity_df),
             mode='markers',
             name=severity,
-            marker=dict(size=15, color=color_map.get(severity, '#6b7280')),
+            marker=dict(size=15, color=SEVERITY_COLORS.get(severity, '#6b7280')),
             text=severity_df['incident_id'],
             hovertemplate='<b>%{text}</b><br>%{x}<br>Severity: %{y}<extra></extra>'
         ))
@@ -343,22 +380,20 @@ def main():
     
     # Metrics Row
     col1, col2, col3, col4 = st.columns(4)
+    severity_counts = count_by_severity(filtered_incidents)
     
     with col1:
         total_incidents = len(filtered_incidents)
         st.metric("📊 Total Incidents", total_incidents)
     
     with col2:
-        critical_count = len([i for i in filtered_incidents if i.get('severity', '').lower() == 'critical'])
-        st.metric("🚨 Critical", critical_count)
+        st.metric("🚨 Critical", severity_counts['critical'])
     
     with col3:
-        high_count = len([i for i in filtered_incidents if i.get('severity', '').lower() == 'high'])
-        st.metric("⚠️ High", high_count)
+        st.metric("⚠️ High", severity_counts['high'])
     
     with col4:
-        warning_count = len([i for i in filtered_incidents if i.get('severity', '').lower() == 'warning'])
-        st.metric("⚡ Warning", warning_count)
+        st.metric("⚡ Warning", severity_counts['warning'])
     
     st.markdown("---")
     
@@ -383,7 +418,7 @@ def main():
             # Additional stats
             st.markdown("### 📊 Statistics")
             total = len(all_incidents)
-            critical = len([i for i in all_incidents if i.get('severity', '').lower() == 'critical'])
+            critical = count_by_severity(all_incidents)['critical']
             
             if total > 0:
                 critical_pct = (critical / total) * 100
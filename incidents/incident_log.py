@@ -1,7 +1,10 @@
 import os
 import json
+import threading
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
+
+_UTC = timezone.utc
 
 
 class DateTimeEncoder(json.JSONEncoder):
@@ -24,7 +27,7 @@ class IncidentLogger:
         
         # Generate unique incident ID
         self.incident_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now(_UTC).strftime("%Y%m%d_%H%M%S")
         
         # Create incident-specific directory
         self.incident_dir = os.path.join(self.output_dir, f"incident_{self.incident_id[:8]}_{timestamp}")
@@ -38,6 +41,13 @@ class IncidentLogger:
         self.raw_metrics_path = os.path.join(self.incident_dir, "raw_cloudwatch_metrics.json")
         self.results_path = os.path.join(self.incident_dir, "results.json")
 
+        # Append-only index of every finalized incident (one results.json
+        # per line), so readers do not have to open each incident directory
+        self.index_path = os.path.join(self.output_dir, "incidents.jsonl")
+
+        # Agents may log from worker threads; one line per write, unmixed
+        self._write_lock = threading.Lock()
+
         with open(self.log_path, "w") as f:
             f.write("")  # create empty file
 
@@ -50,15 +60,17 @@ class IncidentLogger:
 
     def _timestamp(self):
         """Return current UTC timestamp in ISO format."""
-        return datetime.utcnow().isoformat()
+        return datetime.now(_UTC).isoformat()
 
-    def _write(self, entry: dict):
+    def _write(self, entry: dict, timestamp: str = None):
         """Append a JSON entry as a single line."""
-        entry["timestamp"] = self._timestamp()
+        entry["timestamp"] = timestamp or self._timestamp()
         entry["incident_id"] = self.incident_id
 
-        with open(self.log_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, cls=DateTimeEncoder) + "\n")
+        line = json.dumps(entry, cls=DateTimeEncoder) + "\n"
+        with self._write_lock:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(line)
 
     # ----------------------------------------------------------------------
     # PUBLIC LOGGING METHODS (called by orchestrator & agents)
@@ -69,20 +81,28 @@ class IncidentLogger:
         Store raw CloudWatch log events before analysis.
         Also dumps to separate file for verification.
         """
+        now = self._timestamp()
+
         # Write to JSONL for incident trail
-        self._write({"type": "raw_logs", "event_count": len(logs) if isinstance(logs, list) else 0})
+        self._write({"type": "raw_logs", "event_count": len(logs) if isinstance(logs, list) else 0}, now)
         
         # Dump raw logs to separate file for verification
         with open(self.raw_logs_path, "w", encoding="utf-8") as f:
             json.dump({
                 "incident_id": self.incident_id,
-                "fetch_timestamp": self._timestamp(),
+                "fetch_timestamp": now,
                 "event_count": len(logs) if isinstance(logs, list) else 0,
                 "events": logs
             }, f, indent=2, cls=DateTimeEncoder)
         
         print(f"   💾 Raw logs dumped to: {os.path.basename(self.raw_logs_path)}")
 
+    def log_incident_trigger(self, context):
+        """
+        Store the alert that triggered this incident.
+        """
+        self._write({"type": "incident_trigger", "context": context})
+
     def log_logs_analysis(self, analysis):
         """
         Store Logs Agent analysis output.
@@ -100,14 +120,16 @@ class IncidentLogger:
             for datapoints in metrics.values()
         ) if isinstance(metrics, dict) else 0
         
+        now = self._timestamp()
+
         # Write to JSONL for incident trail
-        self._write({"type": "raw_metrics", "metric_count": len(metrics) if isinstance(metrics, dict) else 0})
+        self._write({"type": "raw_metrics", "metric_count": len(metrics) if isinstance(metrics, dict) else 0}, now)
         
         # Dump raw metrics to separate file for verification
         with open(self.raw_metrics_path, "w", encoding="utf-8") as f:
             json.dump({
                 "incident_id": self.incident_id,
-                "fetch_timestamp": self._timestamp(),
+                "fetch_timestamp": now,
                 "metric_count": len(metrics) if isinstance(metrics, dict) else 0,
                 "total_datapoints": total_datapoints,
                 "metrics": metrics
@@ -134,25 +156,31 @@ class IncidentLogger:
         Creates results.json for UI rendering.
         Called by the orchestrator after all analysis is complete.
         """
+        now = self._timestamp()
+        severity = metrics_result.get("overall_severity", "unknown")
+        detected_issues = log_result.get("detected_issues", [])
+        root_cause = rca_result.get("root_cause", "Unknown")
+        recommendation = rca_result.get("recommendation", "None provided")
+
         summary = {
             "type": "incident_summary",
-            "metrics_severity": metrics_result.get("overall_severity", "unknown"),
-            "log_issues_count": len(log_result.get("detected_issues", [])),
-            "root_cause": rca_result.get("root_cause", "Unknown"),
-            "recommendation": rca_result.get("recommendation", "None provided"),
+            "metrics_severity": severity,
+            "log_issues_count": len(detected_issues),
+            "root_cause": root_cause,
+            "recommendation": recommendation,
         }
-        self._write(summary)
+        self._write(summary, now)
         
         # Create results.json for UI
         results = {
             "incident_id": self.incident_id,
-            "timestamp": self._timestamp(),
-            "severity": metrics_result.get("overall_severity", "unknown"),
+            "timestamp": now,
+            "severity": severity,
             "description": metrics_result.get("summary", "No description available"),
-            "detected_issues": log_result.get("detected_issues", []),
+            "detected_issues": detected_issues,
             "log_summary": log_result.get("summary", "No log summary"),
-            "root_cause": rca_result.get("root_cause", "Unknown"),
-            "recommendation": rca_result.get("recommendation", "None provided"),
+            "root_cause": root_cause,
+            "recommendation": recommendation,
             "thinking_log": {
                 "metrics_analysis": metrics_result,
                 "log_analysis": log_result,
@@ -167,6 +195,10 @@ class IncidentLogger:
         
         with open(self.results_path, "w", encoding="utf-8") as f:
             json.dump(results, f, indent=2, cls=DateTimeEncoder)
+
+        index_entry = dict(results, directory=os.path.basename(self.incident_dir))
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(index_entry, cls=DateTimeEncoder) + "\n")
         
         print(f"\n✅ [IncidentLogger] Incident finalized!")
         print(f"   📋 Incident ID: {self.incident_id}")
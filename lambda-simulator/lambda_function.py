@@ -5,45 +5,137 @@ import time
 import boto3
 import os
 import datetime
-import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Bound logger methods by level name; log_event dispatches with one lookup
+_LEVEL_FN = {
+    "INFO": logger.info,
+    "WARNING": logger.warning,
+    "ERROR": logger.error,
+}
+
 cloudwatch = boto3.client("cloudwatch")
 
+_UTC = datetime.timezone.utc
+
+
+def _dumps(obj):
+    # orjson encodes the structured log dicts several times faster
+    return orjson.dumps(obj).decode() if orjson is not None else json.dumps(obj)
+
+
+class _JsonFormatter(logging.Formatter):
+    """
+    Render records carrying structured fields (extra={"fields": {...}}) as a
+    single JSON line, stamped from the record itself. Anything else (e.g.
+    botocore's own logging) goes through the handler's original formatter.
+    """
+
+    def __init__(self, fallback=None):
+        super().__init__()
+        self.fallback = fallback or logging.Formatter()
+
+    def format(self, record):
+        fields = getattr(record, "fields", None)
+        if fields is None:
+            return self.fallback.format(record)
+        return _dumps(
+            {
+                # Epoch milliseconds; nothing downstream needs a preformatted
+                # string (CloudWatch stamps each event itself)
+                "ts": int(record.created * 1000),
+                "level": record.levelname,
+                **fields,
+                # The Lambda runtime's log filter stamps each record with the
+                # current invocation's id; outside Lambda there is none
+                "requestId": getattr(record, "aws_request_id", _REQUEST_ID),
+            }
+        )
+
+
+# The Lambda runtime installs its own handler on the root logger; run
+# locally there is none, so add one to get the same output.
+if not logger.handlers:
+    logger.addHandler(logging.StreamHandler())
+for _handler in logger.handlers:
+    _handler.setFormatter(_JsonFormatter(_handler.formatter))
+
 
 # ----------------------------------------------------------
 # Helper: Generate IDs
 # ----------------------------------------------------------
 def generate_trace_data():
+    # One urandom read covers all three IDs (32 + 16 + 12 hex chars)
+    r = os.urandom(30).hex()
     return {
-        "trace_id": str(uuid.uuid4()),
-        "span_id": str(uuid.uuid4())[:16],
-        "correlation_id": str(uuid.uuid4())[:12],
+        "trace_id": r[:32],
+        "span_id": r[32:48],
+        "correlation_id": r[48:],
     }
 
 
+# ----------------------------------------------------------
+# Latency Simulation
+# ----------------------------------------------------------
+# Scenarios report the latency they model in their metrics and logs either
+# way; actually sleeping only stretches billed duration, so it is opt-in.
+SIMULATE_LATENCY = os.getenv("SIMULATE_LATENCY", "0") == "1"
+
+
+def simulate_latency(seconds):
+    if SIMULATE_LATENCY:
+        time.sleep(seconds)
+
+
+# ----------------------------------------------------------
+# Invocation Mode
+# ----------------------------------------------------------
+# demo:  one critical, one high and one warning scenario per invocation
+# burst: BURST_SIZE scenarios drawn at random from the degradation/symptom mix
+LAMBDA_MODE = os.getenv("LAMBDA_MODE", "demo")
+BURST_SIZE = 10
+_MODE_LABEL = "incident_burst" if LAMBDA_MODE == "burst" else "hackathon_demo"
+
+
 # ----------------------------------------------------------
 # Structured Logging Helper (AWS + K8s + Datadog Hybrid)
 # ----------------------------------------------------------
+# Fields that never change within a container; built once at import.
+_SERVICE_METADATA = {
+    "service": "order-processing-service",
+    "environment": "prod-us-east-1",
+    "version": "v2.13.5-a93fbd2",
+    "component": "order-pipeline",
+}
+# Used when a record carries no aws_request_id (i.e. when run locally)
+_REQUEST_ID = "N/A"
+
+
 def log_event(level, event, message, scenario="unknown", **kwargs):
 
+    log_fn = _LEVEL_FN.get(level)
+    if log_fn is None:
+        return
+
     trace_data = generate_trace_data()
 
+    # ts, level and requestId are added by _JsonFormatter from the record
     log = {
-        "ts": datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-        "level": level,
         "event": event,
         "message": message,
         # Microservice metadata
-        "service": "order-processing-service",
-        "environment": "prod-us-east-1",
-        "version": "v2.13.5-a93fbd2",
-        "component": "order-pipeline",
+        **_SERVICE_METADATA,
         "scenario": scenario,
         # Identifiers
-        "requestId": os.getenv("AWS_REQUEST_ID", "N/A"),
         **trace_data,
         # kube-like metadata
         "pod": f"order-processing-{random.randint(1,5)}",
@@ -52,30 +144,86 @@ def log_event(level, event, message, scenario="unknown", **kwargs):
         "details": kwargs,
     }
 
-    if level == "INFO":
-        logger.info(json.dumps(log))
-    elif level == "WARNING":
-        logger.warning(json.dumps(log))
-    elif level == "ERROR":
-        logger.error(json.dumps(log))
+    log_fn(message, extra={"fields": log})
 
 
 # ----------------------------------------------------------
 # Metric Publisher (scenario-aware)
 # ----------------------------------------------------------
+# Datums are buffered for the whole invocation and sent by flush_metrics(),
+# so one PutMetricData call replaces one round-trip per metric. Scenarios
+# run on worker threads, so the buffer is guarded by a lock. Entries are
+# (name, value, timestamp) tuples, turned into MetricDatum dicts at flush.
+METRIC_NAMESPACE = "Custom/EcommerceOrderPipeline"
+MAX_DATUMS_PER_CALL = 1000
+_metric_buffer = []
+_metric_lock = threading.Lock()
+
+
 def publish_metric(name, value, scenario="unknown"):
-    cloudwatch.put_metric_data(
-        Namespace="Custom/EcommerceOrderPipeline",
-        MetricData=[{"MetricName": name, "Unit": "None", "Value": value}],
+    entry = (name, value, datetime.datetime.now(_UTC))
+    with _metric_lock:
+        _metric_buffer.append(entry)
+    _log_metric_published(name, value, scenario)
+
+
+def _log_metric_published(name, value, scenario):
+    # Same record log_event("INFO", "MetricPublished", ...) would emit,
+    # built inline for the most frequent log line without **kwargs
+    message = f"Published metric {name}={value}"
+    _LEVEL_FN["INFO"](
+        message,
+        extra={
+            "fields": {
+                "event": "MetricPublished",
+                "message": message,
+                **_SERVICE_METADATA,
+                "scenario": scenario,
+                **generate_trace_data(),
+                "pod": f"order-processing-{random.randint(1,5)}",
+                "node": f"ip-10-0-{random.randint(1,255)}-{random.randint(1,255)}",
+                "details": {"metric": name, "value": value},
+            }
+        },
     )
+
+
+def flush_metrics():
+    """Send all buffered datums, MAX_DATUMS_PER_CALL at a time."""
+    with _metric_lock:
+        buffered = [
+            {"MetricName": n, "Unit": "None", "Value": v, "Timestamp": ts}
+            for n, v, ts in _metric_buffer
+        ]
+        _metric_buffer.clear()
+
+    for i in range(0, len(buffered), MAX_DATUMS_PER_CALL):
+        try:
+            cloudwatch.put_metric_data(
+                Namespace=METRIC_NAMESPACE,
+                MetricData=buffered[i : i + MAX_DATUMS_PER_CALL],
+            )
+        except Exception as e:
+            log_event(
+                "ERROR",
+                "MetricFlushIssue",
+                "Failed to publish buffered metrics",
+                scenario="metric_flush",
+                error=str(e),
+                datums=len(buffered[i : i + MAX_DATUMS_PER_CALL]),
+            )
+
+
+def _run_scenario(indexed):
+    i, scenario_func = indexed
     log_event(
         "INFO",
-        "MetricPublished",
-        f"Published metric {name}={value}",
-        scenario=scenario,
-        metric=name,
-        value=value,
+        "ScenarioTriggered",
+        f"Running scenario: {scenario_func.__name__}",
+        scenario=_MODE_LABEL,
+        sequence=i,
     )
+    scenario_func()
 
 
 # ----------------------------------------------------------
@@ -93,39 +241,30 @@ def lambda_handler(event, context):
     log_event(
         "INFO",
         "LambdaStart",
-        "Order-processing Lambda invoked (demo mode)",
-        scenario="hackathon_demo",
+        f"Order-processing Lambda invoked ({LAMBDA_MODE} mode)",
+        scenario=_MODE_LABEL,
     )
 
-    # Scenarios with different severity levels
-    all_scenarios = [
-        simulate_critical_incident,
-        simulate_high_severity_incident,
-        simulate_warning_incident,
-    ]
-
     try:
-        # Generate one of each severity type
-        num_scenarios = 3
-        
-        for i, scenario_func in enumerate(all_scenarios, 1):
-            log_event(
-                "INFO",
-                "ScenarioTriggered",
-                f"Running scenario: {scenario_func.__name__}",
-                scenario="hackathon_demo",
-                sequence=i,
-            )
-            scenario_func()
-
-        return {
-            "statusCode": 200,
-            "body": json.dumps({
+        if LAMBDA_MODE == "burst":
+            scenarios = [random.choice(_BURST_SCENARIOS) for _ in range(BURST_SIZE)]
+            body = {"status": "incident_burst_generated"}
+        else:
+            # Generate one of each severity type
+            scenarios = _DEMO_SCENARIOS
+            body = {
                 "status": "demo_incident_generated",
-                "scenarios_executed": num_scenarios,
-                "severities_generated": ["critical", "high", "warning"]
-            }),
-        }
+                "severities_generated": ["critical", "high", "warning"],
+            }
+
+        # The scenarios only sleep and log, so running them side by side
+        # overlaps their simulated latency.
+        num_scenarios = len(scenarios)
+        with ThreadPoolExecutor(max_workers=num_scenarios) as executor:
+            list(executor.map(_run_scenario, enumerate(scenarios, 1)))
+
+        body["scenarios_executed"] = num_scenarios
+        return {"statusCode": 200, "body": json.dumps(body)}
 
     except Exception as e:
         log_event(
@@ -133,13 +272,16 @@ def lambda_handler(event, context):
             "ScenarioProcessingIssue",
             "Observed unexpected behavior during incident scenario generation",
             error=str(e),
-            scenario="incident_burst",
+            scenario=_MODE_LABEL,
         )
         return {"statusCode": 500, "body": json.dumps({"status": "processing_issue"})}
 
+    finally:
+        flush_metrics()
+
 
 # ----------------------------------------------------------
-# 1️⃣ HEALTHY ORDERS (KEPT FOR REFERENCE, NOT USED IN INCIDENT MODE)
+# 1️⃣ HEALTHY ORDERS (KEPT FOR REFERENCE, NOT USED IN EITHER MODE)
 # ----------------------------------------------------------
 def simulate_healthy_order():
     """
@@ -151,7 +293,7 @@ def simulate_healthy_order():
     user_id = random.randint(1000, 9000)
 
     delay = random.uniform(0.2, 0.9)
-    time.sleep(delay)
+    simulate_latency(delay)
     latency = int(delay * 1000)
 
     publish_metric("CPUUtilization", random.uniform(10, 35), scenario)
@@ -178,7 +320,7 @@ def simulate_minor_degradation():
 
     # Force high latency (above crit 1500ms) and heavy retries
     delay = random.uniform(2.0, 3.0)  # 2000–3000ms
-    time.sleep(delay)
+    simulate_latency(delay)
     latency = int(delay * 1000)
 
     # Force CPU and Memory above crit thresholds
@@ -207,13 +349,7 @@ def simulate_major_symptom():
     """
     Randomly choose one of the symptom patterns, all tuned to be critical.
     """
-    symptom_patterns = [
-        heavy_payment_signal,
-        inventory_slow_signal,
-        shipping_slow_signal,
-        memory_pressure_signal,
-    ]
-    chosen = random.choice(symptom_patterns)
+    chosen = random.choice(_SYMPTOM_PATTERNS)
     chosen()
 
 
@@ -241,7 +377,7 @@ def inventory_slow_signal():
 
     # Make inventory DB latency clearly above crit 900ms
     delay = random.uniform(1.5, 3.0)  # 1500–3000ms
-    time.sleep(delay)
+    simulate_latency(delay)
 
     publish_metric("CPUUtilization", random.uniform(90, 97), scenario)  # crit
     publish_metric("InventoryDBLatencyMS", delay * 1000, scenario)  # crit
@@ -261,7 +397,7 @@ def shipping_slow_signal():
 
     # Force a large delay and multiple downstream timeouts
     delay = random.uniform(2.5, 4.5)
-    time.sleep(delay)
+    simulate_latency(delay)
 
     # DownstreamTimeouts above crit 2
     publish_metric("DownstreamTimeouts", random.randint(3, 5), scenario)
@@ -293,6 +429,15 @@ def memory_pressure_signal():
     )
 
 
+# Built once at import; simulate_major_symptom picks from it per call
+_SYMPTOM_PATTERNS = (
+    heavy_payment_signal,
+    inventory_slow_signal,
+    shipping_slow_signal,
+    memory_pressure_signal,
+)
+
+
 # ----------------------------------------------------------
 # NEW: CRITICAL SEVERITY SCENARIO
 # ----------------------------------------------------------
@@ -301,7 +446,7 @@ def simulate_critical_incident():
     scenario = "critical_system_failure"
     
     delay = random.uniform(2.5, 3.5)  # Very high latency
-    time.sleep(delay)
+    simulate_latency(delay)
     latency = int(delay * 1000)
     
     # All metrics way above critical thresholds
@@ -330,7 +475,7 @@ def simulate_high_severity_incident():
     scenario = "high_resource_contention"
     
     delay = random.uniform(1.8, 2.2)  # High but not extreme
-    time.sleep(delay)
+    simulate_latency(delay)
     latency = int(delay * 1000)
     
     # Metrics above critical threshold but not extreme
@@ -358,7 +503,7 @@ def simulate_warning_incident():
     scenario = "warning_performance_degradation"
     
     delay = random.uniform(1.2, 1.6)  # Moderate latency
-    time.sleep(delay)
+    simulate_latency(delay)
     latency = int(delay * 1000)
     
     # Metrics approaching warning threshold but not critical
@@ -376,3 +521,19 @@ def simulate_warning_incident():
         trend="increasing",
         recommendation="Monitor closely",
     )
+
+
+# Scenarios with different severity levels. lambda_handler runs them
+# concurrently on a thread pool (see _run_scenario), so their log lines
+# interleave and the order across scenarios is not deterministic.
+_DEMO_SCENARIOS = (
+    simulate_critical_incident,
+    simulate_high_severity_incident,
+    simulate_warning_incident,
+)
+
+# Mix sampled by LAMBDA_MODE=burst
+_BURST_SCENARIOS = (
+    simulate_minor_degradation,
+    simulate_major_symptom,
+)
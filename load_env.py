@@ -1,16 +1,18 @@
 import os
 
+from dotenv import dotenv_values
+
 
 def load_aws_env():
     """Load AWS credentials from .env.ts file"""
     try:
-        with open(".env", "r") as f:
-            for line in f:
-                if line.startswith("export "):
-                    key_value = line.replace("export ", "").strip()
-                    if "=" in key_value:
-                        key, value = key_value.split("=", 1)
-                        os.environ[key] = value
+        if not os.path.isfile(".env"):
+            raise FileNotFoundError(".env")
+        # python-dotenv handles "export ", quoting and inline comments;
+        # values are taken literally, without ${VAR} expansion
+        for key, value in dotenv_values(".env", interpolate=False).items():
+            if value is not None:
+                os.environ[key] = value
         print("✓ AWS credentials loaded from .env")
     except FileNotFoundError:
         print("✗ .env file not found")
@@ -1,16 +1,29 @@
 import boto3
 import json
+import os
 import datetime
 import time
+from operator import itemgetter
+
+from tools.jsonutil import json_loads
 
 # -------------------------------------
 # AWS CLIENTS - FORCE CORRECT REGION
 # -------------------------------------
 logs_client = boto3.client("logs", region_name="us-east-2")
 metrics_client = boto3.client("cloudwatch", region_name="us-east-2")
+# Only the alarm-driven loop needs SQS; built on first wait_for_alarm()
+_sqs_client = None
 
 UTC = datetime.timezone.utc
 
+POLL_DEBUG = os.environ.get("POLL_DEBUG", "0") == "1"
+
+# SQS queue subscribed (via SNS) to CloudWatch alarm state changes. When
+# set, the loop below only polls CloudWatch after an alarm fires instead
+# of on a fixed timer.
+ALARM_QUEUE_URL = os.environ.get("ALARM_QUEUE_URL")
+
 
 # -------------------------------------
 # Time helper
@@ -30,32 +43,36 @@ def fetch_recent_logs(
     start_time = int(minutes_ago(minutes).timestamp() * 1000)
 
     events = []
+    append = events.append  # bound once; called per event
     try:
         response = logs_client.filter_log_events(
             logGroupName=log_group, startTime=start_time
         )
 
-        # Debug output to verify raw AWS result
-        print("\n\n================ DEBUG LOGS RESPONSE ================")
-        print(json.dumps(response, indent=2, default=str))
-        print("=====================================================\n\n")
+        # Debug output to verify raw AWS result. Pretty-printing the whole
+        # response costs more than parsing it, so only do it on request.
+        if POLL_DEBUG:
+            print("\n\n================ DEBUG LOGS RESPONSE ================")
+            print(json.dumps(response, indent=2, default=str))
+            print("=====================================================\n\n")
 
         for event in response.get("events", []):
             msg = event.get("message", "")
 
             # Structured JSON logs appear embedded inside AWS wrappers:
             # Example: "[INFO] 2025... {json...}"
-            if "{" in msg and "}" in msg:
+            # Lambda terminates lines with "\n", so only the opening brace is
+            # a reliable pre-filter; one find() locates and slices it.
+            start = msg.find("{")
+            if start >= 0:
                 try:
-                    json_part = msg[msg.index("{") :]
-                    decoded = json.loads(json_part)
-                    events.append(decoded)
+                    append(json_loads(msg[start:]))
                     continue
                 except Exception:
                     pass
 
             # If not JSON, store raw log
-            events.append({"raw": msg})
+            append({"raw": msg})
 
     except Exception as e:
         return [{"error": f"LOG FETCH FAILED: {str(e)}"}]
@@ -97,7 +114,7 @@ def fetch_recent_metrics(
             )
 
             datapoints = sorted(
-                data.get("Datapoints", []), key=lambda x: x["Timestamp"]
+                data.get("Datapoints", []), key=itemgetter("Timestamp")
             )
 
             results[metric_name] = [
@@ -134,12 +151,65 @@ def poll_cloudwatch(
     }
 
 
+# -------------------------------------
+# Alarm Notifications
+# -------------------------------------
+def _get_sqs_client():
+    global _sqs_client
+    if _sqs_client is None:
+        _sqs_client = boto3.client("sqs", region_name="us-east-2")
+    return _sqs_client
+
+
+def wait_for_alarm(queue_url: str, wait_seconds: int = 20) -> bool:
+    """
+    Long-poll the alarm queue once. Returns True (after deleting the
+    messages) if any alarm notification arrived within wait_seconds.
+    """
+    sqs_client = _get_sqs_client()
+    try:
+        resp = sqs_client.receive_message(
+            QueueUrl=queue_url,
+            MaxNumberOfMessages=10,
+            WaitTimeSeconds=wait_seconds,
+        )
+    except Exception as e:
+        # Throttling, expired credentials, a deleted queue: report it and
+        # let the loop retry instead of killing it. The pause keeps a
+        # persistent failure from spinning.
+        print(f"⚠️  ALARM QUEUE RECEIVE FAILED: {str(e)}")
+        time.sleep(5)
+        return False
+
+    messages = resp.get("Messages", [])
+    if messages:
+        try:
+            sqs_client.delete_message_batch(
+                QueueUrl=queue_url,
+                Entries=[
+                    {"Id": str(i), "ReceiptHandle": m["ReceiptHandle"]}
+                    for i, m in enumerate(messages)
+                ],
+            )
+        except Exception as e:
+            # The alarm still fired; undeleted messages only come back
+            # after the visibility timeout and trigger one extra poll
+            print(f"⚠️  ALARM QUEUE DELETE FAILED: {str(e)}")
+    return bool(messages)
+
+
 # -------------------------------------
 # Manual Test Loop
 # -------------------------------------
 if __name__ == "__main__":
-    print("\n🔍 Polling CloudWatch (CTRL+C to stop)...\n")
+    if ALARM_QUEUE_URL:
+        print("\n🔔 Waiting for CloudWatch alarm notifications (CTRL+C to stop)...\n")
+    else:
+        print("\n🔍 Polling CloudWatch (CTRL+C to stop)...\n")
     while True:
+        if ALARM_QUEUE_URL and not wait_for_alarm(ALARM_QUEUE_URL):
+            continue
+
         snapshot = poll_cloudwatch()
 
         print("\n==========================")
@@ -154,4 +224,5 @@ if __name__ == "__main__":
 
         print("\n-----------------------------------------\n")
 
-        time.sleep(5)
+        if not ALARM_QUEUE_URL:
+            time.sleep(5)
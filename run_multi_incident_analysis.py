@@ -5,10 +5,13 @@ Detects individual alerts from CloudWatch and creates separate incidents for eac
 """
 
 import os
+import re
 import sys
-import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-import uuid
+from typing import Any
 
 # Ensure project root is importable
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -19,13 +22,45 @@ try:
 except ImportError:
     load_dotenv = None
 
-from tools.cloudwatch_logs_tool import get_recent_logs
-from tools.cloudwatch_metrics_tool import get_recent_metrics
+from tools.cloudwatch_logs_tool import ALERT_FILTER_PATTERN, CloudWatchLogsTool
+from tools.cloudwatch_metrics_tool import CloudWatchMetricsTool
+from tools.jsonutil import json_loads
 from incidents.incident_log import IncidentLogger
 from agents.log_analysis_agent import LogAnalysisAgent
-from agents.metrics_analysis_agent import MetricsAnalysisAgent
+from agents.metrics_analysis_agent import MetricAnalysisAgent
 from agents.rca_agent import RCAAgent
 
+# Only WARNING/ERROR events or "critical" scenarios become alerts, so any line
+# that matches neither can be skipped before paying for a JSON parse.
+# The level regex and the "critical" substring checks are kept separate on
+# purpose: folding them into one alternation loses sre's literal-prefix scan
+# and is several times slower on typical Lambda log lines.
+_ALERT_LEVEL_RE = re.compile(r'"level"\s*:\s*"(?:WARN|WARNING|ERROR|CRITICAL|FATAL)"')
+# Levels that always produce an incident once the payload is decoded
+_ALERT_LEVELS = frozenset(("ERROR", "WARNING"))
+
+@dataclass(slots=True)
+class CriticalAlert:
+    """A single alert extracted from the log stream"""
+    timestamp: Any
+    level: str
+    event: str
+    message: str
+    scenario: str
+    details: dict
+    full_data: dict
+
+    def to_dict(self):
+        return {
+            "timestamp": self.timestamp,
+            "level": self.level,
+            "event": self.event,
+            "message": self.message,
+            "scenario": self.scenario,
+            "details": self.details,
+            "full_data": self.full_data,
+        }
+
 
 def load_env():
     if load_dotenv is not None:
@@ -35,92 +70,107 @@ def load_env():
             load_dotenv(env_path)
 
 
-def extract_critical_alerts(logs_bundle):
-    """Extract individual critical alerts from logs"""
-    alerts = []
-    
-    for log_event in logs_bundle:
+def iter_critical_alerts(log_events):
+    """Lazily parse and filter log events, yielding only critical alerts"""
+    for log_event in log_events:
         message = log_event.get("message", "")
         timestamp = log_event.get("timestamp", "")
+
+        # Non-JSON lines can never be alerts; reject them without a parse attempt
+        if not message.startswith("{"):
+            continue
+
+        if (
+            not _ALERT_LEVEL_RE.search(message)
+            and "Critical" not in message
+            and "critical" not in message
+        ):
+            continue
         
         try:
-            if message.startswith("{"):
-                log_data = json.loads(message)
-                level = log_data.get("level", "INFO")
-                event = log_data.get("event", "Unknown")
-                scenario = log_data.get("scenario", "unknown")
-                msg = log_data.get("message", "")
-                
-                # Only create incidents for WARNING, ERROR, or critical events
-                if level in ["ERROR", "WARNING"] or "Critical" in msg or "critical" in scenario:
-                    alerts.append({
-                        "timestamp": timestamp,
-                        "level": level,
-                        "event": event,
-                        "message": msg,
-                        "scenario": scenario,
-                        "details": log_data.get("details", {}),
-                        "full_data": log_data
-                    })
+            log_data = json_loads(message)
+            level = log_data.get("level", "INFO")
+            event = log_data.get("event", "Unknown")
+            scenario = log_data.get("scenario", "unknown")
+            msg = log_data.get("message", "")
+            
+            # Only create incidents for WARNING, ERROR, or critical events
+            if level in _ALERT_LEVELS or "Critical" in msg or "critical" in scenario:
+                yield CriticalAlert(
+                    timestamp,
+                    level,
+                    event,
+                    msg,
+                    scenario,
+                    log_data.get("details", {}),
+                    log_data,
+                )
         except:
             continue
-    
-    return alerts
+
+
+def extract_critical_alerts(logs_bundle):
+    """Extract individual critical alerts from logs"""
+    return list(iter_critical_alerts(logs_bundle))
 
 
 def create_incident_for_alert(alert, all_logs, all_metrics):
     """Create a separate incident for a specific alert"""
-    incident_id = str(uuid.uuid4())[:8]
-    
     print(f"\n{'='*60}")
     print(f"🔍 Creating Incident for Alert")
     print(f"{'='*60}")
-    print(f"Level: {alert['level']}")
-    print(f"Event: {alert['event']}")
-    print(f"Message: {alert['message']}")
-    print(f"Scenario: {alert['scenario']}")
+    print(f"Level: {alert.level}")
+    print(f"Event: {alert.event}")
+    print(f"Message: {alert.message}")
+    print(f"Scenario: {alert.scenario}")
     
     # Create incident logger
-    incident_logger = IncidentLogger(incident_id=incident_id)
+    incident_logger = IncidentLogger()
+    incident_id = incident_logger.incident_id[:8]
     incident_logger.log_raw_logs(all_logs)
     incident_logger.log_raw_metrics(all_metrics)
     
     # Focus the context on this specific alert
+    alert_dict = alert.to_dict()
     focused_context = {
-        "primary_alert": alert,
+        "primary_alert": alert_dict,
         "alert_context": {
-            "level": alert["level"],
-            "event_type": alert["event"],
-            "scenario": alert["scenario"],
-            "details": alert["details"]
+            "level": alert.level,
+            "event_type": alert.event,
+            "scenario": alert.scenario,
+            "details": alert.details
         }
     }
     
-    incident_logger.log_event("incident_trigger", focused_context)
+    incident_logger.log_incident_trigger(focused_context)
     
     try:
-        # Analyze logs with focus on this alert
+        # Log and metrics analyses are independent model calls; run them
+        # side by side and only wait for both before RCA. IncidentLogger
+        # serializes their writes to the shared incident file.
         log_agent = LogAnalysisAgent()
-        log_result = log_agent.analyze(all_logs, incident_logger, alert_focus=alert)
-        print(f"✅ Log Analysis: {log_result.get('severity', 'unknown')}")
-        
-        # Analyze metrics
-        metrics_agent = MetricsAnalysisAgent()
-        metrics_result = metrics_agent.analyze(all_metrics, incident_logger)
-        print(f"✅ Metrics Analysis: {metrics_result.get('severity', 'unknown')}")
+        metrics_agent = MetricAnalysisAgent()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            log_future = pool.submit(log_agent.analyze, all_logs, incident_logger)
+            metrics_future = pool.submit(
+                metrics_agent.analyze, all_metrics, incident_logger
+            )
+            log_result = log_future.result()
+            metrics_result = metrics_future.result()
+
+        print(f"✅ Log Analysis: {len(log_result.get('detected_issues', []))} issues")
+        print(f"✅ Metrics Analysis: {metrics_result.get('overall_severity', 'unknown')}")
         
-        # Root cause analysis focused on this alert
+        # Root cause analysis; the alert itself is recorded above as the
+        # incident trigger
         rca_agent = RCAAgent()
         rca_result = rca_agent.analyze(
-            logs_result=log_result,
-            metrics_result=metrics_result,
-            incident_logger=incident_logger,
-            alert_context=alert
+            metrics_result, log_result.get("summary", ""), incident_logger
         )
         print(f"✅ RCA Complete: {rca_result.get('root_cause', 'Unknown')}")
         
         # Finalize and persist
-        incident_logger.finalize_and_persist()
+        incident_logger.finalize_and_persist(metrics_result, log_result, rca_result)
         
         print(f"\n✅ Incident {incident_id} created successfully!")
         print(f"📁 Location: {incident_logger.incident_dir}")
@@ -141,22 +191,13 @@ def main():
     print("="*60)
     print("🚀 Multi-Incident Analysis System")
     print("="*60)
-    print("\n📊 Step 1: Fetching CloudWatch data...")
-    
-    # Get all logs and metrics
-    logs_bundle = get_recent_logs()
-    metrics_bundle = get_recent_metrics()
-    
-    print(f"   ✅ Retrieved {len(logs_bundle) if logs_bundle else 0} log events")
-    print(f"   ✅ Retrieved {len(metrics_bundle) if metrics_bundle else 0} metric types")
-    
-    if not logs_bundle or len(logs_bundle) == 0:
-        print("\n⚠️  No logs found. Run the Lambda function first!")
-        return
+    print("\n📊 Step 1: Checking CloudWatch for alerts...")
     
-    # Extract individual alerts
-    print(f"\n📋 Step 2: Extracting individual alerts...")
-    alerts = extract_critical_alerts(logs_bundle)
+    # Ask CloudWatch for alert lines only; most windows have none, and then
+    # the full log bundle and metrics are never downloaded
+    logs_tool = CloudWatchLogsTool()
+    alert_events = logs_tool.get_recent_logs(filter_pattern=ALERT_FILTER_PATTERN)
+    alerts = extract_critical_alerts(alert_events)
     
     print(f"   ✅ Found {len(alerts)} critical alerts")
     
@@ -164,12 +205,17 @@ def main():
         print("\n⚠️  No critical alerts found to create incidents.")
         return
     
+    # The agents still need the full INFO/ERROR mix for context
+    print(f"\n📋 Step 2: Fetching CloudWatch data...")
+    logs_bundle = logs_tool.get_recent_logs()
+    metrics_bundle = CloudWatchMetricsTool().get_recent_metrics()
+    
+    print(f"   ✅ Retrieved {len(logs_bundle) if logs_bundle else 0} log events")
+    print(f"   ✅ Retrieved {len(metrics_bundle) if metrics_bundle else 0} metric types")
+    
     # Show summary
     print(f"\n📊 Alert Summary:")
-    level_counts = {}
-    for alert in alerts:
-        level = alert['level']
-        level_counts[level] = level_counts.get(level, 0) + 1
+    level_counts = Counter(alert.level for alert in alerts)
     
     for level, count in level_counts.items():
         print(f"   {level}: {count} alerts")
@@ -193,9 +239,9 @@ def main():
         if incident_logger:
             incidents_created.append({
                 'id': incident_logger.incident_id,
-                'level': alert['level'],
-                'event': alert['event'],
-                'message': alert['message']
+                'level': alert.level,
+                'event': alert.event,
+                'message': alert.message
             })
     
     # Summary
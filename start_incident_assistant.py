@@ -69,9 +69,17 @@ def aws_sanity_check():
     # CloudWatch Logs
     try:
         logs_client = boto3.client("logs", region_name=region)
-        resp = logs_client.describe_log_groups(logGroupNamePrefix=log_group)
+        # Other groups can share the prefix, so walk full 50-group pages
+        # (the API maximum) and stop at the first exact match
+        paginator = logs_client.get_paginator("describe_log_groups")
+        pages = paginator.paginate(
+            logGroupNamePrefix=log_group,
+            PaginationConfig={"PageSize": 50},
+        )
         found = any(
-            lg.get("logGroupName") == log_group for lg in resp.get("logGroups", [])
+            lg.get("logGroupName") == log_group
+            for page in pages
+            for lg in page.get("logGroups", [])
         )
         if found:
             print(f"  ✅ CloudWatch Logs reachable: {log_group}")
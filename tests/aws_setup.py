@@ -0,0 +1,32 @@
+# tests/aws_setup.py
+
+import os
+
+# Shared by the script entry points and the pytest fixtures in
+# tests/conftest.py. The tools (and through them boto3/strands) are
+# imported inside the functions so collecting the tests stays cheap.
+
+
+def aws_region():
+    return os.getenv("AWS_DEFAULT_REGION", "us-east-2")
+
+
+def make_session(region):
+    import boto3
+
+    return boto3.session.Session(region_name=region)
+
+
+def make_clients(session, region):
+    """(lambda_client, logs_tool, metrics_tool), all built from one session."""
+    from tools.aws_clients import get_client
+    from tools.cloudwatch_logs_tool import CloudWatchLogsTool
+    from tools.cloudwatch_metrics_tool import CloudWatchMetricsTool
+
+    log_group = os.getenv("LOG_GROUP_NAME", "/aws/lambda/cloudwatch-log-generator")
+    namespace = os.getenv("METRICS_NAMESPACE", "Custom/EcommerceOrderPipeline")
+    return (
+        get_client("lambda", region, session=session),
+        CloudWatchLogsTool(log_group_name=log_group, session=session),
+        CloudWatchMetricsTool(namespace=namespace, session=session),
+    )
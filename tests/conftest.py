@@ -0,0 +1,38 @@
+# tests/conftest.py
+
+import os
+
+import pytest
+
+from tests.aws_setup import aws_region, make_clients, make_session
+
+# These tests invoke the real Lambda and read real CloudWatch data, so they
+# only run when asked for. The fixtures are session-scoped so a full run
+# resolves credentials and builds each client once.
+
+
+@pytest.fixture(scope="session")
+def session():
+    if not os.getenv("RUN_AWS_TESTS"):
+        pytest.skip("set RUN_AWS_TESTS=1 to run tests against AWS")
+    return make_session(aws_region())
+
+
+@pytest.fixture(scope="session")
+def aws_clients(session):
+    return make_clients(session, aws_region())
+
+
+@pytest.fixture(scope="session")
+def lambda_client(aws_clients):
+    return aws_clients[0]
+
+
+@pytest.fixture(scope="session")
+def logs_tool(aws_clients):
+    return aws_clients[1]
+
+
+@pytest.fixture(scope="session")
+def metrics_tool(aws_clients):
+    return aws_clients[2]
@@ -0,0 +1,96 @@
+import os
+import json
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from run_multi_incident_analysis import _ALERT_LEVEL_RE, iter_critical_alerts
+
+
+def baseline_extract_critical_alerts(logs_bundle):
+    """extract_critical_alerts as it was before the pre-filter/orjson/generator
+    rewrites; the reference the current path must agree with."""
+    alerts = []
+
+    for log_event in logs_bundle:
+        message = log_event.get("message", "")
+        timestamp = log_event.get("timestamp", "")
+
+        try:
+            if message.startswith("{"):
+                log_data = json.loads(message)
+                level = log_data.get("level", "INFO")
+                event = log_data.get("event", "Unknown")
+                scenario = log_data.get("scenario", "unknown")
+                msg = log_data.get("message", "")
+
+                if level in ["ERROR", "WARNING"] or "Critical" in msg or "critical" in scenario:
+                    alerts.append({
+                        "timestamp": timestamp,
+                        "level": level,
+                        "event": event,
+                        "message": msg,
+                        "scenario": scenario,
+                        "details": log_data.get("details", {}),
+                        "full_data": log_data
+                    })
+        except Exception:
+            continue
+
+    return alerts
+
+
+FIXTURE_MESSAGES = [
+    # Simulator output (compact separators)
+    '{"ts":1,"level":"INFO","event":"LambdaStart","message":"Order-processing Lambda invoked","scenario":"hackathon_demo","details":{}}',
+    '{"ts":2,"level":"ERROR","event":"PaymentGatewayTimeout","message":"Payment provider timed out","scenario":"payment_signal_critical","details":{"timeout_ms":5000}}',
+    '{"ts":3,"level":"WARNING","event":"HighLatency","message":"Order latency above SLO","scenario":"latency_warning","details":{}}',
+    '{"ts":4,"level":"INFO","event":"MetricPublished","message":"Published metric ErrorRate=0.2","scenario":"payment_signal_critical","details":{"metric":"ErrorRate"}}',
+    '{"ts":5,"level":"CRITICAL","event":"InventoryDown","message":"Critical dependency unreachable","scenario":"inventory_outage","details":{}}',
+    '{"ts":6,"level":"CRITICAL","event":"InventoryDown","message":"dependency unreachable","scenario":"inventory_outage","details":{}}',
+    '{"ts":7,"level":"INFO","event":"Recovered","message":"critical path healthy","scenario":"healthy_order","details":{}}',
+    # json.dumps default separators, key order, missing fields
+    '{"level": "WARNING", "message": "retrying"}',
+    '{"event": "NoLevel", "scenario": "critical_failure"}',
+    '{"level" : "ERROR"}',
+    '{"level": "error", "message": "lowercase level"}',
+    '{"level": "WARN", "message": "short warn level"}',
+    '{"level": 3, "message": "numeric level"}',
+    '{"level": "INFO", "message": null, "scenario": "critical"}',
+    '{"level": "INFO", "message": 5, "scenario": "normal"}',
+    # Values only the stdlib parser accepts
+    '{"level": "ERROR", "event": "BadValue", "details": {"v": NaN}}',
+    '{"level": "WARNING", "details": {"v": -Infinity}}',
+    # Not alerts / not JSON
+    '{"level": "ERROR", "message": "truncated"',
+    "START RequestId: 0f3c Version: $LATEST",
+    "REPORT RequestId: 0f3c Duration: 12.3 ms Billed Duration: 13 ms",
+    "[ERROR]\t2025-01-01T00:00:00Z\t0f3c\tplain text error",
+    "",
+]
+
+
+def _events():
+    return [{"message": m, "timestamp": i} for i, m in enumerate(FIXTURE_MESSAGES)]
+
+
+def test_alerts_match_baseline_extraction():
+    events = _events()
+
+    expected = baseline_extract_critical_alerts(events)
+    actual = [alert.to_dict() for alert in iter_critical_alerts(events)]
+
+    # NaN != NaN, so compare the serialized form
+    assert json.dumps(actual) == json.dumps(expected)
+    assert expected  # the fixture must actually exercise the alert path
+
+
+def test_prefilter_keeps_every_baseline_alert():
+    for alert in baseline_extract_critical_alerts(_events()):
+        message = FIXTURE_MESSAGES[alert["timestamp"]]
+        assert (
+            _ALERT_LEVEL_RE.search(message)
+            or "Critical" in message
+            or "critical" in message
+        ), message
@@ -0,0 +1,36 @@
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from agents.common import parse_llm_json
+
+FALLBACK = {"overall_severity": "unknown"}
+
+
+def test_plain_json_reply():
+    assert parse_llm_json('  {"a": 1}\n', FALLBACK) == {"a": 1}
+
+
+def test_fenced_reply():
+    assert parse_llm_json('```json\n{"a": 1}\n```', FALLBACK) == {"a": 1}
+
+
+def test_fence_without_newline_before_closing_backticks():
+    assert parse_llm_json('```json\n{"a": 1}```', FALLBACK) == {"a": 1}
+    assert parse_llm_json('```json\n{\n  "a": 1\n}```', FALLBACK) == {"a": 1}
+
+
+def test_single_line_fence():
+    assert parse_llm_json('```{"a": 1}```', FALLBACK) == {"a": 1}
+
+
+def test_unparseable_reply_returns_copy_of_fallback():
+    result = parse_llm_json("The service looks healthy.", FALLBACK)
+    assert result == FALLBACK
+    assert result is not FALLBACK
+
+
+def test_unparseable_reply_without_fallback():
+    assert parse_llm_json("```\nnot json\n```", None) is None
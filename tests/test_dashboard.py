@@ -0,0 +1,56 @@
+import json
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+# dashboard.py is a Streamlit app; its UI dependencies are not in
+# requirements.txt
+pytest.importorskip("streamlit")
+pytest.importorskip("pandas")
+pytest.importorskip("plotly")
+
+import dashboard
+
+
+def test_load_incident_index_missing_file(tmp_path):
+    assert dashboard.load_incident_index(str(tmp_path)) == {}
+
+
+def test_load_incident_index_keys_by_directory(tmp_path):
+    entries = [
+        {"incident_id": "a1", "severity": "critical", "directory": "incident_a1"},
+        {"incident_id": "b2", "severity": "ok", "directory": "incident_b2"},
+        {"incident_id": "c3", "severity": "high"},  # no directory: skipped
+    ]
+    lines = [json.dumps(e) for e in entries]
+    # A partially written trailing line is ignored
+    (tmp_path / "incidents.jsonl").write_text(
+        "\n".join(lines) + '\n{"incident_id": "d4", "sev', encoding="utf-8"
+    )
+
+    indexed = dashboard.load_incident_index(str(tmp_path))
+
+    assert sorted(indexed) == ["incident_a1", "incident_b2"]
+    assert indexed["incident_a1"]["severity"] == "critical"
+    assert indexed["incident_a1"]["directory"] == str(tmp_path / "incident_a1")
+
+
+def test_count_by_severity_folds_case():
+    incidents = [
+        {"severity": "CRITICAL"},
+        {"severity": "critical"},
+        {"severity": "High"},
+        {"severity": "ok"},
+        {},
+    ]
+    counts = dashboard.count_by_severity(incidents)
+
+    assert counts["critical"] == 2
+    assert counts["high"] == 1
+    assert counts["ok"] == 1
+    assert counts[""] == 1
+    assert counts["warning"] == 0
@@ -0,0 +1,74 @@
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT_DIR, "lambda-simulator"))
+
+# The simulator builds its CloudWatch client at import; it never calls AWS here
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import lambda_function
+
+
+class FakeCloudWatch:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+    def put_metric_data(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.fail:
+            raise RuntimeError("throttled")
+
+
+@pytest.fixture
+def cloudwatch(monkeypatch):
+    client = FakeCloudWatch()
+    monkeypatch.setattr(lambda_function, "cloudwatch", client)
+    lambda_function._metric_buffer.clear()
+    return client
+
+
+def _publish(count):
+    for i in range(count):
+        lambda_function.publish_metric("ErrorRate", float(i), scenario="test")
+
+
+@pytest.mark.parametrize("count", [13, 26])
+def test_flush_sends_one_call_under_the_limit(cloudwatch, count):
+    _publish(count)
+    lambda_function.flush_metrics()
+
+    assert len(cloudwatch.calls) == 1
+    call = cloudwatch.calls[0]
+    assert call["Namespace"] == lambda_function.METRIC_NAMESPACE
+    assert [d["Value"] for d in call["MetricData"]] == [float(i) for i in range(count)]
+    assert lambda_function._metric_buffer == []
+
+
+@pytest.mark.parametrize("count, batches", [(13, [10, 3]), (26, [10, 10, 6])])
+def test_flush_splits_at_max_datums_per_call(cloudwatch, monkeypatch, count, batches):
+    monkeypatch.setattr(lambda_function, "MAX_DATUMS_PER_CALL", 10)
+    _publish(count)
+    lambda_function.flush_metrics()
+
+    assert [len(c["MetricData"]) for c in cloudwatch.calls] == batches
+    datum = cloudwatch.calls[0]["MetricData"][0]
+    assert set(datum) == {"MetricName", "Unit", "Value", "Timestamp"}
+
+
+def test_flush_with_empty_buffer_sends_nothing(cloudwatch):
+    lambda_function.flush_metrics()
+    assert cloudwatch.calls == []
+
+
+def test_failed_batch_does_not_stop_the_rest(cloudwatch, monkeypatch):
+    cloudwatch.fail = True
+    monkeypatch.setattr(lambda_function, "MAX_DATUMS_PER_CALL", 10)
+    _publish(26)
+    lambda_function.flush_metrics()
+
+    assert len(cloudwatch.calls) == 3
+    assert lambda_function._metric_buffer == []
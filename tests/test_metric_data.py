@@ -0,0 +1,103 @@
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from tools.metric_data import (
+    MAX_QUERIES_PER_REQUEST,
+    get_metric_data,
+    merge_stats,
+    metric_query,
+)
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _ts(minute):
+    return T0 + timedelta(minutes=minute)
+
+
+class FakeCloudWatch:
+    """
+    Answers every query with two points, split across two pages: the first
+    page carries minute 0 and a NextToken, the second carries minute 1.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def get_metric_data(self, **kwargs):
+        self.calls.append(kwargs)
+        minute = 1 if kwargs.get("NextToken") else 0
+        resp = {
+            "MetricDataResults": [
+                {"Id": q["Id"], "Timestamps": [_ts(minute)], "Values": [float(minute)]}
+                for q in kwargs["MetricDataQueries"]
+            ]
+        }
+        if minute == 0:
+            resp["NextToken"] = "page-2"
+        return resp
+
+
+def _queries(n):
+    return [metric_query(f"q{i}", "Custom/Test", "ErrorRate", "Average") for i in range(n)]
+
+
+def test_metric_query_shape():
+    query = metric_query(
+        "m0", "AWS/Lambda", "Errors", "Sum", [{"Name": "FunctionName", "Value": "fn"}]
+    )
+    assert query == {
+        "Id": "m0",
+        "MetricStat": {
+            "Metric": {
+                "Namespace": "AWS/Lambda",
+                "MetricName": "Errors",
+                "Dimensions": [{"Name": "FunctionName", "Value": "fn"}],
+            },
+            "Period": 60,
+            "Stat": "Sum",
+        },
+        "ReturnData": True,
+    }
+
+
+def test_get_metric_data_follows_next_token():
+    client = FakeCloudWatch()
+    series = get_metric_data(client, _queries(3), T0, _ts(10))
+
+    assert len(client.calls) == 2
+    assert "NextToken" not in client.calls[0]
+    assert client.calls[1]["NextToken"] == "page-2"
+    assert series == {f"q{i}": [(_ts(0), 0.0), (_ts(1), 1.0)] for i in range(3)}
+
+
+def test_get_metric_data_batches_queries():
+    client = FakeCloudWatch()
+    queries = _queries(MAX_QUERIES_PER_REQUEST + 1)
+    series = get_metric_data(client, queries, T0, _ts(10))
+
+    # Two batches, each paged twice
+    batch_sizes = [len(call["MetricDataQueries"]) for call in client.calls]
+    assert batch_sizes == [MAX_QUERIES_PER_REQUEST] * 2 + [1] * 2
+    assert all(call["ScanBy"] == "TimestampAscending" for call in client.calls)
+    assert len(series) == len(queries)
+    assert series[f"q{MAX_QUERIES_PER_REQUEST}"] == [(_ts(0), 0.0), (_ts(1), 1.0)]
+
+
+def test_merge_stats_rebuilds_datapoints_in_time_order():
+    series = {
+        "avg": [(_ts(1), 2.0), (_ts(0), 1.0)],
+        "max": [(_ts(0), 5.0)],
+    }
+    assert merge_stats(series, {"Average": "avg", "Maximum": "max", "Sum": "missing"}) == [
+        {"Timestamp": _ts(0), "Average": 1.0, "Maximum": 5.0},
+        {"Timestamp": _ts(1), "Average": 2.0},
+    ]
+
+
+def test_merge_stats_empty():
+    assert merge_stats({}, {"Average": "avg"}) == []
@@ -1,9 +1,24 @@
-from .cloudwatch_logs_tool import tool_get_recent_logs
-from .cloudwatch_metrics_tool import tool_get_recent_metrics
-from .thresholds_tool import ThresholdsTool
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing one tool does not load strands and every other tool with it.
+import importlib
+
+_EXPORTS = {
+    "tool_get_recent_logs": ".cloudwatch_logs_tool",
+    "tool_get_recent_metrics": ".cloudwatch_metrics_tool",
+    "ThresholdsTool": ".thresholds_tool",
+}
 
 __all__ = [
     "tool_get_recent_logs",
     "tool_get_recent_metrics",
     "ThresholdsTool",
 ]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,49 @@
+# tools/aws_clients.py
+
+# boto3 pulls in hundreds of modules, so it is imported on first use
+# rather than when the tools package is imported.
+
+_clients = {}
+_config = None
+
+
+def _client_config():
+    global _config
+    if _config is None:
+        from botocore.config import Config
+
+        # Bulk log pulls page through many filter_log_events calls and the
+        # orchestrator/tests fetch concurrently; a pool well above botocore's
+        # default of 10 keeps them from queueing for a connection, and
+        # adaptive retries back off on throttling.
+        _config = Config(
+            retries={"max_attempts": 3, "mode": "adaptive"},
+            max_pool_connections=50,
+            tcp_keepalive=True,
+        )
+    return _config
+
+
+def get_client(service_name, region_name, session=None):
+    """
+    Return a process-wide boto3 client for (service, region).
+    Clients are thread-safe and expensive to build, so they are shared.
+
+    When a boto3 Session is given, the client is built from it instead (so
+    it reuses that session's resolved credentials) and is not cached here.
+    """
+    if session is not None:
+        return session.client(
+            service_name, region_name=region_name, config=_client_config()
+        )
+
+    key = (service_name, region_name)
+    client = _clients.get(key)
+    if client is None:
+        import boto3
+
+        client = boto3.client(
+            service_name, region_name=region_name, config=_client_config()
+        )
+        _clients[key] = client
+    return client
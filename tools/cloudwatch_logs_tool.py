@@ -1,40 +1,99 @@
 # tools/cloudwatch_logs_tool.py
 
-import boto3
 import os
 from datetime import datetime, timedelta, timezone
+from itertools import islice
 from strands import tool
 
+from .aws_clients import get_client
+
+# Server-side selector for the records extract_critical_alerts keeps:
+# WARNING/ERROR levels, "Critical" messages and "critical" scenarios. The
+# simulator writes each record as a bare JSON line, so JSON selectors apply.
+ALERT_FILTER_PATTERN = (
+    '{ ($.level = "ERROR") || ($.level = "WARNING")'
+    ' || ($.message = "*Critical*") || ($.scenario = "*critical*") }'
+)
+
+# Largest page FilterLogEvents returns
+MAX_PAGE_SIZE = 10000
+
 
 class CloudWatchLogsTool:
-    def __init__(self):
+    def __init__(self, log_group_name=None, session=None):
         region = (
-            os.environ.get("AWS_REGION")
+            (session.region_name if session is not None else None)
+            or os.environ.get("AWS_REGION")
             or os.environ.get("AWS_DEFAULT_REGION")
             or "us-east-1"
         )
-        self.logs_client = boto3.client("logs", region_name=region)
+        self.logs_client = get_client("logs", region, session=session)
 
-        self.log_group_name = os.environ.get(
+        self.log_group_name = log_group_name or os.environ.get(
             "LOG_GROUP_NAME", "/aws/lambda/cloudwatch-log-generator"
         )
 
-    def get_recent_logs(self, minutes=10):
+    def _iter_log_events(
+        self, start_ms, end_ms, filter_pattern=None, page_size=MAX_PAGE_SIZE
+    ):
+        """
+        Yield every event in the window, following nextToken across pages.
+        With a filter_pattern, CloudWatch drops non-matching events before
+        they are sent.
+        """
+        kwargs = {
+            "logGroupName": self.log_group_name,
+            "startTime": start_ms,
+            "endTime": end_ms,
+            "PaginationConfig": {"PageSize": page_size},
+        }
+        if filter_pattern:
+            kwargs["filterPattern"] = filter_pattern
+
+        paginator = self.logs_client.get_paginator("filter_log_events")
+        for page in paginator.paginate(**kwargs):
+            yield from page.get("events", [])
+
+    def get_recent_logs(
+        self, minutes=10, filter_pattern=None, head=None, start_ms=None
+    ):
+        """
+        Events from the last `minutes` (or since start_ms, epoch millis, when
+        given), oldest first across every stream. With head, return only the
+        first `head` of them; no further pages are requested once it is
+        reached.
+        """
         now = datetime.now(timezone.utc)
-        start = now - timedelta(minutes=minutes)
+        if start_ms is None:
+            start_ms = int((now - timedelta(minutes=minutes)).timestamp() * 1000)
+        end_ms = int(now.timestamp() * 1000)
 
         try:
-            response = self.logs_client.filter_log_events(
-                logGroupName=self.log_group_name,
-                startTime=int(start.timestamp() * 1000),
-                endTime=int(now.timestamp() * 1000),
-            )
-            return response.get("events", [])
+            if head is None:
+                events = self._iter_log_events(start_ms, end_ms, filter_pattern)
+            else:
+                # Size the first page to head too, so a small head does not
+                # download (and parse) a full 10k-event page
+                events = islice(
+                    self._iter_log_events(
+                        start_ms, end_ms, filter_pattern, min(head, MAX_PAGE_SIZE)
+                    ),
+                    head,
+                )
+            return list(events)
         except Exception as e:
             return [{"error": str(e)}]
 
 
-_logs_tool_instance = CloudWatchLogsTool()
+_logs_tool_instance = None
+
+
+def _get_instance():
+    # Built on first tool call so importing the module does not create clients
+    global _logs_tool_instance
+    if _logs_tool_instance is None:
+        _logs_tool_instance = CloudWatchLogsTool()
+    return _logs_tool_instance
 
 
 @tool
@@ -42,4 +101,4 @@ def tool_get_recent_logs(minutes: int = 10):
     """
     LLM-callable tool for CloudWatch log events.
     """
-    return _logs_tool_instance.get_recent_logs(minutes)
+    return _get_instance().get_recent_logs(minutes)
@@ -1,21 +1,26 @@
 # tools/cloudwatch_metrics_tool.py
 
-import boto3
 import os
 from datetime import datetime, timedelta, timezone
 from strands import tool
 
+from .aws_clients import get_client
+from .metric_data import get_metric_data, merge_stats, metric_query
+
+STATISTICS = ("Average", "Sum", "Minimum", "Maximum", "SampleCount")
+
 
 class CloudWatchMetricsTool:
-    def __init__(self):
+    def __init__(self, namespace=None, session=None):
         region = (
-            os.environ.get("AWS_REGION")
+            (session.region_name if session is not None else None)
+            or os.environ.get("AWS_REGION")
             or os.environ.get("AWS_DEFAULT_REGION")
             or "us-east-1"
         )
-        self.cloudwatch = boto3.client("cloudwatch", region_name=region)
+        self.cloudwatch = get_client("cloudwatch", region, session=session)
 
-        self.namespace = os.environ.get(
+        self.namespace = namespace or os.environ.get(
             "METRICS_NAMESPACE", "Custom/EcommerceOrderPipeline"
         )
         
@@ -33,29 +38,42 @@ class CloudWatchMetricsTool:
     def get_recent_metrics(self, minutes=10):
         now = datetime.now(timezone.utc)
         start = now - timedelta(minutes=minutes)
-        
+
+        # One query per (metric, statistic), all sent in a single request
+        queries = []
+        ids = {}
+        for i, metric_name in enumerate(self.metric_names):
+            ids[metric_name] = {}
+            for stat in STATISTICS:
+                query_id = f"m{i}_{stat.lower()}"
+                ids[metric_name][stat] = query_id
+                queries.append(
+                    metric_query(query_id, self.namespace, metric_name, stat)
+                )
+
+        try:
+            series = get_metric_data(self.cloudwatch, queries, start, now)
+        except Exception as e:
+            return {metric_name: [{"error": str(e)}] for metric_name in self.metric_names}
+
         all_metrics = {}
-        
         for metric_name in self.metric_names:
-            try:
-                response = self.cloudwatch.get_metric_statistics(
-                    Namespace=self.namespace,
-                    MetricName=metric_name,
-                    StartTime=start,
-                    EndTime=now,
-                    Period=60,
-                    Statistics=["Average", "Sum", "Minimum", "Maximum", "SampleCount"],
-                )
-                datapoints = response.get("Datapoints", [])
-                if datapoints:
-                    all_metrics[metric_name] = datapoints
-            except Exception as e:
-                all_metrics[metric_name] = [{"error": str(e)}]
-        
+            datapoints = merge_stats(series, ids[metric_name])
+            if datapoints:
+                all_metrics[metric_name] = datapoints
+
         return all_metrics
 
 
-_metrics_tool_instance = CloudWatchMetricsTool()
+_metrics_tool_instance = None
+
+
+def _get_instance():
+    # Built on first tool call so importing the module does not create clients
+    global _metrics_tool_instance
+    if _metrics_tool_instance is None:
+        _metrics_tool_instance = CloudWatchMetricsTool()
+    return _metrics_tool_instance
 
 
 @tool
@@ -63,4 +81,4 @@ def tool_get_recent_metrics(minutes: int = 10):
     """
     LLM-callable tool for CloudWatch metrics.
     """
-    return _metrics_tool_instance.get_recent_metrics(minutes)
+    return _get_instance().get_recent_metrics(minutes)
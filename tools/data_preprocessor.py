@@ -1,9 +1,12 @@
 # tools/data_preprocessor.py
 
 import json
-from collections import defaultdict
+import math
+from collections import Counter, defaultdict
 from datetime import datetime
 
+from .jsonutil import json_loads
+
 
 class DataPreprocessor:
     """
@@ -27,12 +30,14 @@ class DataPreprocessor:
                 "samples": [],
             }
 
+        max_errors = 10
+
         # Count by level
         level_counts = defaultdict(int)
         error_events = []
         warning_events = []
-        scenarios = defaultdict(int)
-        event_types = defaultdict(int)
+        scenarios = Counter()
+        event_types = Counter()
 
         for log_event in logs_bundle:
             message = log_event.get("message", "")
@@ -40,7 +45,7 @@ class DataPreprocessor:
             # Try to parse JSON in message
             try:
                 if message.startswith("{"):
-                    log_data = json.loads(message)
+                    log_data = json_loads(message)
                     level = log_data.get("level", "INFO")
                     event = log_data.get("event", "Unknown")
                     scenario = log_data.get("scenario", "unknown")
@@ -49,11 +54,14 @@ class DataPreprocessor:
                     event_types[event] += 1
                     scenarios[scenario] += 1
 
-                    # Collect errors and warnings for sampling
+                    # Collect errors and warnings for sampling; only the first
+                    # few of each are ever used, so stop retaining past that
                     if level == "ERROR":
-                        error_events.append(log_data)
+                        if len(error_events) < max_errors:
+                            error_events.append(log_data)
                     elif level == "WARNING":
-                        warning_events.append(log_data)
+                        if len(warning_events) < max_samples:
+                            warning_events.append(log_data)
             except:
                 # Not JSON, just count as INFO
                 level_counts["UNPARSED"] += 1
@@ -62,7 +70,7 @@ class DataPreprocessor:
         sampled_events = []
 
         # Prioritize ERROR events
-        sampled_events.extend(error_events[:10])
+        sampled_events.extend(error_events[:max_errors])
 
         # Add some WARNING events
         remaining_slots = max_samples - len(sampled_events)
@@ -72,8 +80,9 @@ class DataPreprocessor:
         summary = {
             "total_events": len(logs_bundle),
             "level_distribution": dict(level_counts),
-            "top_scenarios": dict(sorted(scenarios.items(), key=lambda x: x[1], reverse=True)[:5]),
-            "top_event_types": dict(sorted(event_types.items(), key=lambda x: x[1], reverse=True)[:10]),
+            # most_common(n) is a heap selection, not a full sort of every key
+            "top_scenarios": dict(scenarios.most_common(5)),
+            "top_event_types": dict(event_types.most_common(10)),
             "critical_samples": [
                 {
                     "level": evt.get("level"),
@@ -105,38 +114,50 @@ class DataPreprocessor:
             "metrics": {},
         }
 
+        metrics_out = summary["metrics"]
         for metric_name, datapoints in metrics_bundle.items():
             if not datapoints or not isinstance(datapoints, list):
-                summary["metrics"][metric_name] = {"status": "no_data"}
+                metrics_out[metric_name] = {"status": "no_data"}
                 continue
 
             # Check for errors
-            if datapoints and "error" in datapoints[0]:
-                summary["metrics"][metric_name] = {
+            first = datapoints[0]
+            if "error" in first:
+                metrics_out[metric_name] = {
                     "status": "error",
-                    "error": datapoints[0].get("error"),
+                    "error": first.get("error"),
                 }
                 continue
 
-            # Calculate statistics from datapoints
-            if datapoints:
-                averages = [dp.get("Average", 0) for dp in datapoints if "Average" in dp]
-                maximums = [dp.get("Maximum", 0) for dp in datapoints if "Maximum" in dp]
-                minimums = [dp.get("Minimum", 0) for dp in datapoints if "Minimum" in dp]
-                sample_counts = [dp.get("SampleCount", 0) for dp in datapoints if "SampleCount" in dp]
-
-                metric_summary = {
-                    "datapoint_count": len(datapoints),
-                    "total_samples": sum(sample_counts) if sample_counts else 0,
-                }
+            # Pull every column out in one pass over the datapoints
+            averages = []
+            maximums = []
+            minimums = []
+            total_samples = 0
+            for dp in datapoints:
+                value = dp.get("Average")
+                if value is not None:
+                    averages.append(value)
+                value = dp.get("Maximum")
+                if value is not None:
+                    maximums.append(value)
+                value = dp.get("Minimum")
+                if value is not None:
+                    minimums.append(value)
+                total_samples += dp.get("SampleCount", 0)
+
+            metric_summary = {
+                "datapoint_count": len(datapoints),
+                "total_samples": total_samples,
+            }
 
-                if averages:
-                    metric_summary["avg_value"] = sum(averages) / len(averages)
-                    metric_summary["max_value"] = max(maximums) if maximums else None
-                    metric_summary["min_value"] = min(minimums) if minimums else None
-                    metric_summary["latest_value"] = averages[-1] if averages else None
+            if averages:
+                metric_summary["avg_value"] = math.fsum(averages) / len(averages)
+                metric_summary["max_value"] = max(maximums) if maximums else None
+                metric_summary["min_value"] = min(minimums) if minimums else None
+                metric_summary["latest_value"] = averages[-1]
 
-                summary["metrics"][metric_name] = metric_summary
+            metrics_out[metric_name] = metric_summary
 
         return summary
 
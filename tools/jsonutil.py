@@ -0,0 +1,24 @@
+# tools/jsonutil.py
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+
+    def json_loads(text):
+        """
+        Decode JSON with orjson, retrying with the stdlib parser on what
+        orjson rejects but json.dumps writes by default (NaN, Infinity).
+        """
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+
+else:
+    json_loads = json.loads
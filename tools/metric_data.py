@@ -0,0 +1,64 @@
+# tools/metric_data.py
+
+# GetMetricData accepts at most 500 queries per request
+MAX_QUERIES_PER_REQUEST = 500
+
+
+def metric_query(query_id, namespace, metric_name, stat, dimensions=(), period=60):
+    """
+    One GetMetricData query for a single statistic of a metric.
+    """
+    return {
+        "Id": query_id,
+        "MetricStat": {
+            "Metric": {
+                "Namespace": namespace,
+                "MetricName": metric_name,
+                "Dimensions": list(dimensions),
+            },
+            "Period": period,
+            "Stat": stat,
+        },
+        "ReturnData": True,
+    }
+
+
+def get_metric_data(cloudwatch, queries, start, end):
+    """
+    Run the queries through GetMetricData (following NextToken) and
+    return {query Id: [(timestamp, value), ...]} in ascending time.
+    """
+    series = {q["Id"]: [] for q in queries}
+
+    for i in range(0, len(queries), MAX_QUERIES_PER_REQUEST):
+        kwargs = {
+            "MetricDataQueries": queries[i : i + MAX_QUERIES_PER_REQUEST],
+            "StartTime": start,
+            "EndTime": end,
+            "ScanBy": "TimestampAscending",
+        }
+        while True:
+            resp = cloudwatch.get_metric_data(**kwargs)
+            for result in resp.get("MetricDataResults", []):
+                series[result["Id"]].extend(
+                    zip(result.get("Timestamps", []), result.get("Values", []))
+                )
+
+            token = resp.get("NextToken")
+            if not token:
+                break
+            kwargs["NextToken"] = token
+
+    return series
+
+
+def merge_stats(series, ids_by_stat):
+    """
+    Rebuild get_metric_statistics-style datapoints ({"Timestamp": ..,
+    "Average": .., ...}) from per-statistic GetMetricData series.
+    """
+    by_ts = {}
+    for stat, query_id in ids_by_stat.items():
+        for ts, value in series.get(query_id, []):
+            by_ts.setdefault(ts, {"Timestamp": ts})[stat] = value
+    return [by_ts[ts] for ts in sorted(by_ts)]
@@ -1,9 +1,17 @@
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
 
+@lru_cache(maxsize=8)
+def _read_thresholds(path: str, mtime_ns: int) -> Dict[str, Any]:
+    # mtime_ns is part of the cache key so an edited file is re-read
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 class ThresholdsTool:
     """
     Utility for loading metric thresholds from a JSON file.
@@ -35,8 +43,13 @@ class ThresholdsTool:
         )
 
     def load_thresholds(self) -> Dict[str, Any]:
-        if not self.path.exists():
+        """
+        Parsed thresholds, cached per process. The returned dict is shared
+        between callers and must be treated as read-only.
+        """
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(f"Thresholds file not found at: {self.path}")
 
-        with self.path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return _read_thresholds(str(self.path), mtime_ns)